@@ -104,6 +104,22 @@ def test_equality() -> None:
                         assert e1 != e2
 
 
+def test_hash() -> None:
+    equal_pairs = [
+        (du, UnitArray()),
+        (UnitArray('a'), raw_UnitArray([('a', 1, 1)])),
+        (raw_UnitArray([('a', 2, 1)]), raw_UnitArray([('a', 6, 3)])),
+        (raw_UnitArray([('a', 1, 1), ('b', -1, 2)]), UnitArray('a') / UnitArray('b') ** 0.5),
+    ]
+    for a, b in equal_pairs:
+        assert hash(a) == hash(b)
+
+    d = {raw_UnitArray([('a', 1, 1), ('b', 2, 1)]): 'ab2'}
+    assert d[UnitArray('a') * UnitArray('b') ** 2] == 'ab2'
+    assert raw_UnitArray([('b', 2, 1), ('a', 1, 1)]) not in d
+    assert raw_UnitArray([('a', 1, 1), ('b', 1, 1)]) not in d
+
+
 def test_multiplicative_identity() -> None:
     various = [UnitArray('a'), raw_UnitArray([('a', 2, 3), ('b', 1, 1)]), du]
     for e in various:
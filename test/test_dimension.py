@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Iterator
+from typing import Any, Iterator
 import inspect
+import weakref
 
 import pytest
 
@@ -34,6 +35,13 @@ def _all_dimensions() -> Iterator[type[core.ValueWithDimension]]:
 
 
 _ALL_DIMENSIONS = [*_all_dimensions()]
+_ALL_ARRAY_DIMENSIONS = [
+    obj
+    for obj in vars(core).values()
+    if inspect.isclass(obj)
+    and issubclass(obj, core.ArrayWithDimension)
+    and obj is not core.ArrayWithDimension
+]
 
 
 @pytest.mark.parametrize('dimension', _ALL_DIMENSIONS)
@@ -104,3 +112,39 @@ def test_dimension_with_wrong_unit_raises() -> None:
 
     with pytest.raises(ValueError, match='not a valid unit for dimension'):
         _ = tunits.TimeArray([1], 'm')
+
+
+class _Jerk(core.Dimension):
+    @staticmethod
+    def valid_base_units() -> tuple[core.Value, ...]:
+        return (tunits.units.m / tunits.units.s**3,)
+
+
+class Jerk(_Jerk, core.ValueWithDimension): ...
+
+
+def test_dimension_defined_outside_module() -> None:
+    assert Jerk.is_valid(tunits.Value(1, 'm/s^3'))
+    assert Jerk(1, 'm/s^3') == tunits.Value(1, 'm/s^3')
+
+    with pytest.raises(ValueError, match='not a valid unit for dimension'):
+        _ = Jerk(1, 'm/s^2')
+
+
+def test_dimension_without_valid_base_units_raises() -> None:
+    class _Nothing(core.Dimension): ...
+
+    class Nothing(_Nothing, core.ValueWithDimension): ...
+
+    with pytest.raises(NotImplementedError, match='_valid_base_units'):
+        _ = Nothing(1, 'm')
+
+
+@pytest.mark.parametrize('dimension', [*_ALL_DIMENSIONS, *_ALL_ARRAY_DIMENSIONS])
+def test_no_instance_dict(
+    dimension: 'type[core.ValueWithDimension] | type[core.ArrayWithDimension[Any]]',
+) -> None:
+    u = dimension.valid_base_units()[0]
+    v = dimension([1, 2] if issubclass(dimension, core.ArrayWithDimension) else 1, u)
+    assert not hasattr(v, '__dict__')
+    assert weakref.ref(v)() is v
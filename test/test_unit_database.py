@@ -253,6 +253,54 @@ def test_parse_unit_formula() -> None:
     assert db.parse_unit_formula('cats/dogs') == cats / dogs
     assert db.parse_unit_formula('cats/dogs^2') == cats / dogs**2
     assert db.parse_unit_formula('cats/dogs*mice') == (cats / dogs) * mice
+    assert db.parse_unit_formula('1/dogs') == dogs**-1
+    assert db.parse_unit_formula('cats^1/2') == cats**0.5
+    assert db.parse_unit_formula('dogs^-3/2*mice') == dogs**-1.5 * mice
+
+    # Inputs outside the simple tokenizer fall back to the full grammar.
+    assert db.parse_unit_formula('cats^(1/2)') == cats**0.5
+    assert db.parse_unit_formula('cats^-(2)') == cats**-2
+    assert db.parse_unit_formula('cats * dogs / mice') == cats * dogs / mice
+
+    # Both paths read a zero exponent numerator as 1 and reject a zero denominator.
+    assert db.parse_unit_formula('cats^0') == cats
+    assert db.parse_unit_formula('cats^(0)') == cats
+    with pytest.raises(ValueError, match='denominator'):
+        db.parse_unit_formula('cats^1/0')
+    with pytest.raises(ValueError, match='denominator'):
+        db.parse_unit_formula('cats^(1/0)')
+
+
+def test_parse_unit_formula_is_memoized() -> None:
+    db = UnitDatabase(auto_create_units=False)
+    db.add_root_unit('cats')
+    db.add_root_unit('dogs')
+
+    first = db.parse_unit_formula('cats/dogs^2')
+    assert db.parse_unit_formula('cats/dogs^2') is first
+    assert first == db.get_unit('cats') / db.get_unit('dogs') ** 2
+
+    # Failed parses aren't cached.
+    with pytest.raises(KeyError):
+        db.parse_unit_formula('cats*mice')
+    db.add_root_unit('mice')
+    assert db.parse_unit_formula('cats*mice') == db.get_unit('cats') * db.get_unit('mice')
+
+    # Formulas needing the full grammar, e.g. with a scalar factor, aren't cached.
+    assert db.parse_unit_formula('2.5*cats') is not db.parse_unit_formula('2.5*cats')
+    assert db.parse_unit_formula('cats * dogs') is not db.parse_unit_formula('cats * dogs')
+
+
+def test_parse_unit_formula_cache_is_bounded() -> None:
+    db = UnitDatabase(auto_create_units=False)
+    db.add_root_unit('cats')
+
+    for i in range(2, 3000):
+        assert db.parse_unit_formula(f'cats^{i}') == db.get_unit('cats') ** i
+
+    # Early formulas stay cached, later ones are parsed every time.
+    assert db.parse_unit_formula('cats^2') is db.parse_unit_formula('cats^2')
+    assert db.parse_unit_formula('cats^2999') is not db.parse_unit_formula('cats^2999')
 
 
 def test_parse_float_formula() -> None:
@@ -16,6 +16,7 @@ import numbers
 
 import itertools
 import pickle
+import weakref
 
 import numpy as np
 import pytest
@@ -97,6 +98,8 @@ def test_repr() -> None:
     assert repr(Value(1, mm)) == "Value(1, 'mm')"
     assert repr(Value(4, mm)) == "Value(4, 'mm')"
     assert repr(Value(1j + 5, km * kg)) == "Value((5+1j), 'kg*km')"
+    assert repr(Value(3, 'm^2')) == "Value(3.0, 'm^2')"
+    assert repr(Value(3, 'm*s')) == "Value(3.0, 'm*s')"
 
 
 def test_str() -> None:
@@ -289,3 +292,11 @@ def test_format() -> None:
 
     assert f'{tu.GHz}' == 'GHz'
     assert f'{2*tu.GHz}' == '2 GHz'
+
+
+def test_no_instance_dict() -> None:
+    v = Value(1, 'm')
+    assert not hasattr(v, '__dict__')
+    assert weakref.ref(v)() is v
+    with pytest.raises(AttributeError):
+        v.foo = 1  # type: ignore
@@ -14,6 +14,7 @@
 
 import itertools
 import pickle
+import weakref
 
 import numpy as np
 import pytest
@@ -154,6 +155,9 @@ def test_array_dtype() -> None:
     with pytest.raises(TypeError):
         c += 1j
 
+    for formula in ['m^2', 'Hz^2', 'm*s', 'm^-2', '1', '1.0']:
+        assert ValueArray([1, 2], formula).value.dtype == np.float64
+
 
 def test_multi_index() -> None:
     from tunits.units import m
@@ -302,3 +306,11 @@ def test_matmul() -> None:
     d: tu.TimeArray = b @ a  # type: ignore[assignment]
     assert c.allclose((a @ b[tu.us]) * tu.us)
     assert d.allclose((b[tu.s] @ a) * tu.s)
+
+
+def test_no_instance_dict() -> None:
+    v = ValueArray([1, 2], 'm')
+    assert not hasattr(v, '__dict__')
+    assert weakref.ref(v)() is v
+    with pytest.raises(AttributeError):
+        v.foo = 1  # type: ignore
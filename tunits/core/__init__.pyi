@@ -1,5 +1,4 @@
 from typing import ClassVar, Sequence, Any, Callable, Iterator, overload, Generic, SupportsIndex
-import abc
 from attrs import frozen
 from typing_extensions import TypeVar
 from numpy.typing import NDArray, DTypeLike
@@ -394,293 +393,210 @@ def init_base_unit_functions(
     is_value_consistent_with_default_unit_database: Callable[[Any], bool],
 ) -> None: ...
 
-class Dimension(abc.ABC):
+class Dimension:
     """Dimension abstraction.
 
-    This abstract class allows the creation of values that belong to a dimension
+    This base class allows the creation of values that belong to a dimension
     (e.g. t: Time, x: Length, ...etc). This allows us to use static types to check
     code correctness (e.g. time_method(t: Time)).
 
     To add a new dimension, create 3 classes:
-        - `class _NewDimension(Dimension):` which implements the abstract methods from
-            this class.
+        - `class _NewDimension(Dimension):` which sets `_valid_base_units` (or
+            overrides `valid_base_units()`).
         - `class NewDimension(_NewDimension, ValueWithDimension)` which represents scalar
             values and doesn't need to implement any methods.
         - `class AccelerationArray(_Acceleration, ArrayWithDimension)` which represents
             an array of values sharing the same dimension and unit.
     """
 
-    @staticmethod
-    @abc.abstractmethod
-    def valid_base_units() -> tuple[Value, ...]:
-        """Returns a tuple of valid base units (e.g. (dB, dBm) for LogPower)."""
+    _valid_base_units: ClassVar[tuple[Value, ...]]
 
     @classmethod
-    def is_valid(cls, v: WithUnit) -> bool: ...
-
-class ValueWithDimension(abc.ABC, Value):
-    @staticmethod
-    @abc.abstractmethod
-    def valid_base_units() -> tuple[Value, ...]:
+    def valid_base_units(cls) -> tuple[Value, ...]:
         """Returns a tuple of valid base units (e.g. (dB, dBm) for LogPower)."""
 
     @classmethod
     def is_valid(cls, v: WithUnit) -> bool: ...
-    def __getitem__(self: ValueType2, unit: ValueType2 | str) -> float: ...
 
-class ArrayWithDimension(abc.ABC, ValueArray[ValueType2]):
-    @staticmethod
-    @abc.abstractmethod
-    def valid_base_units() -> tuple[Value, ...]:
-        """Returns a tuple of valid base units (e.g. (dB, dBm) for LogPower)."""
+class ValueWithDimension(Dimension, Value):
+    def __getitem__(self: ValueType2, unit: ValueType2 | str) -> float: ...
 
-    @classmethod
-    def is_valid(cls, v: WithUnit) -> bool: ...
+class ArrayWithDimension(Dimension, ValueArray[ValueType2]):
     def __iter__(self) -> Iterator[ValueType2]: ...
 
-class _Acceleration(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Acceleration(Dimension): ...
 
 class Acceleration(_Acceleration, ValueWithDimension): ...
 class AccelerationArray(_Acceleration, ArrayWithDimension[Acceleration]): ...
 
-class _Angle(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Angle(Dimension): ...
 
 class Angle(_Angle, ValueWithDimension): ...
 class AngleArray(_Angle, ArrayWithDimension[Angle]): ...
 
-class _AngularFrequency(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _AngularFrequency(Dimension): ...
 
 class AngularFrequency(_AngularFrequency, ValueWithDimension): ...
 class AngularFrequencyArray(_AngularFrequency, ArrayWithDimension[AngularFrequency]): ...
 
-class _Area(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Area(Dimension): ...
 
 class Area(_Area, ValueWithDimension): ...
 class AreaArray(_Area, ArrayWithDimension[Area]): ...
 
-class _Capacitance(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Capacitance(Dimension): ...
 
 class Capacitance(_Capacitance, ValueWithDimension): ...
 class CapacitanceArray(_Capacitance, ArrayWithDimension[Capacitance]): ...
 
-class _Charge(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Charge(Dimension): ...
 
 class Charge(_Charge, ValueWithDimension): ...
 class ChargeArray(_Charge, ArrayWithDimension[Charge]): ...
 
-class _CurrentDensity(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _CurrentDensity(Dimension): ...
 
 class CurrentDensity(_CurrentDensity, ValueWithDimension): ...
 class CurrentDensityArray(_CurrentDensity, ArrayWithDimension[CurrentDensity]): ...
 
-class _Density(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Density(Dimension): ...
 
 class Density(_Density, ValueWithDimension): ...
 class DensityArray(_Density, ArrayWithDimension[Density]): ...
 
-class _ElectricCurrent(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _ElectricCurrent(Dimension): ...
 
 class ElectricCurrent(_ElectricCurrent, ValueWithDimension): ...
 class ElectricCurrentArray(_ElectricCurrent, ArrayWithDimension[ElectricCurrent]): ...
 
-class _ElectricPotential(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _ElectricPotential(Dimension): ...
 
 class ElectricPotential(_ElectricPotential, ValueWithDimension): ...
 class ElectricPotentialArray(_ElectricPotential, ArrayWithDimension[ElectricPotential]): ...
 
-class _ElectricalConductance(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _ElectricalConductance(Dimension): ...
 
 class ElectricalConductance(_ElectricalConductance, ValueWithDimension): ...
 class ElectricalConductanceArray(
     _ElectricalConductance, ArrayWithDimension[ElectricalConductance]
 ): ...
 
-class _Energy(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Energy(Dimension): ...
 
 class Energy(_Energy, ValueWithDimension): ...
 class EnergyArray(_Energy, ArrayWithDimension[Energy]): ...
 
-class _Force(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Force(Dimension): ...
 
 class Force(_Force, ValueWithDimension): ...
 class ForceArray(_Force, ArrayWithDimension[Force]): ...
 
-class _Frequency(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Frequency(Dimension): ...
 
 class Frequency(_Frequency, ValueWithDimension): ...
 class FrequencyArray(_Frequency, ArrayWithDimension[Frequency]): ...
 
-class _Illuminance(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Illuminance(Dimension): ...
 
 class Illuminance(_Illuminance, ValueWithDimension): ...
 class IlluminanceArray(_Illuminance, ArrayWithDimension[Illuminance]): ...
 
-class _Inductance(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Inductance(Dimension): ...
 
 class Inductance(_Inductance, ValueWithDimension): ...
 class InductanceArray(_Inductance, ArrayWithDimension[Inductance]): ...
 
-class _Length(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Length(Dimension): ...
 
 class Length(_Length, ValueWithDimension): ...
 class LengthArray(_Length, ArrayWithDimension[Length]): ...
 
-class _LogPower(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _LogPower(Dimension): ...
 
 class LogPower(_LogPower, ValueWithDimension): ...
 class LogPowerArray(_LogPower, ArrayWithDimension[LogPower]): ...
 
-class _LuminousFlux(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _LuminousFlux(Dimension): ...
 
 class LuminousFlux(_LuminousFlux, ValueWithDimension): ...
 class LuminousFluxArray(_LuminousFlux, ArrayWithDimension[LuminousFlux]): ...
 
-class _LuminousIntensity(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _LuminousIntensity(Dimension): ...
 
 class LuminousIntensity(_LuminousIntensity, ValueWithDimension): ...
 class LuminousIntensityArray(_LuminousIntensity, ArrayWithDimension[LuminousIntensity]): ...
 
-class _MagneticFlux(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _MagneticFlux(Dimension): ...
 
 class MagneticFlux(_MagneticFlux, ValueWithDimension): ...
 class MagneticFluxArray(_MagneticFlux, ArrayWithDimension[MagneticFlux]): ...
 
-class _MagneticFluxDensity(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _MagneticFluxDensity(Dimension): ...
 
 class MagneticFluxDensity(_MagneticFluxDensity, ValueWithDimension): ...
 class MagneticFluxDensityArray(_MagneticFluxDensity, ArrayWithDimension[MagneticFluxDensity]): ...
 
-class _Mass(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Mass(Dimension): ...
 
 class Mass(_Mass, ValueWithDimension): ...
 class MassArray(_Mass, ArrayWithDimension[Mass]): ...
 
-class _Noise(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Noise(Dimension): ...
 
 class Noise(_Noise, ValueWithDimension): ...
 class NoiseArray(_Noise, ArrayWithDimension[Noise]): ...
 
-class _Power(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Power(Dimension): ...
 
 class Power(_Power, ValueWithDimension): ...
 class PowerArray(_Power, ArrayWithDimension[Power]): ...
 
-class _Pressure(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Pressure(Dimension): ...
 
 class Pressure(_Pressure, ValueWithDimension): ...
 class PressureArray(_Pressure, ArrayWithDimension[Pressure]): ...
 
-class _Quantity(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Quantity(Dimension): ...
 
 class Quantity(_Quantity, ValueWithDimension): ...
 class QuantityArray(_Quantity, ArrayWithDimension[Quantity]): ...
 
-class _Resistance(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Resistance(Dimension): ...
 
 class Resistance(_Resistance, ValueWithDimension): ...
 class ResistanceArray(_Resistance, ArrayWithDimension[Resistance]): ...
 
-class _Speed(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Speed(Dimension): ...
 
 class Speed(_Speed, ValueWithDimension): ...
 class SpeedArray(_Speed, ArrayWithDimension[Speed]): ...
 
-class _SurfaceDensity(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _SurfaceDensity(Dimension): ...
 
 class SurfaceDensity(_SurfaceDensity, ValueWithDimension): ...
 class SurfaceDensityArray(_SurfaceDensity, ArrayWithDimension[SurfaceDensity]): ...
 
-class _Temperature(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Temperature(Dimension): ...
 
 class Temperature(_Temperature, ValueWithDimension): ...
 class TemperatureArray(_Temperature, ArrayWithDimension[Temperature]): ...
 
-class _Time(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Time(Dimension): ...
 
 class Time(_Time, ValueWithDimension): ...
 class TimeArray(_Time, ArrayWithDimension[Time]): ...
 
-class _Torque(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Torque(Dimension): ...
 
 class Torque(_Torque, ValueWithDimension): ...
 class TorqueArray(_Torque, ArrayWithDimension[Torque]): ...
 
-class _Volume(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _Volume(Dimension): ...
 
 class Volume(_Volume, ValueWithDimension): ...
 class VolumeArray(_Volume, ArrayWithDimension[Volume]): ...
 
-class _WaveNumber(Dimension):
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]: ...
+class _WaveNumber(Dimension): ...
 
 class WaveNumber(_WaveNumber, ValueWithDimension): ...
 class WaveNumberArray(_WaveNumber, ArrayWithDimension[WaveNumber]): ...
@@ -36,6 +36,16 @@ cdef conversion identity_conversion():
     return c
 
 
+cdef conversion make_conversion(double factor, long long numer, long long denom, int exp10):
+    """Returns a conversion with the given parts, without building a dict."""
+    cdef conversion c
+    c.factor = factor
+    c.ratio.numer = numer
+    c.ratio.denom = denom
+    c.exp10 = exp10
+    return c
+
+
 @cython.cdivision(True)
 cpdef double conversion_to_double(conversion c):
     """Returns a double that approximates the given conversion."""
@@ -19,52 +19,85 @@ that belong to a dimension (e.g. t: Time, x: Length, ...etc). This allows us to
 use static types to check code correctness (e.g. time_method(t: Time)).
 
 To add a new dimension, create 3 classes:
-- `class _NewDimension(Dimension):` which implements the abstract methods from
-    the abstract `Dimension` class.
+- `class _NewDimension(Dimension):` which sets `_valid_base_units` (or overrides
+    `valid_base_units()`) and implements `_value_class` and `_array_class`.
 - `class NewDimension(_NewDimension, ValueWithDimension)` which represents scalar
     values and doesn't need to implement any methods.
 - `class AccelerationArray(_Acceleration, ArrayWithDimension)` which represents
     an array of values sharing the same dimension and
 """
 
-import abc
 
-from functools import cache
-
-
-class Dimension(abc.ABC):
+class Dimension:
     """Dimension abstraction.
 
-    This abstract class allows the creation of values that belong to a dimension
+    This base class allows the creation of values that belong to a dimension
     (e.g. t: Time, x: Length, ...etc). This allows us to use static types to check
-    code correctness (e.g. time_method(t: Time)).
-
-    To add a new dimension, create 3 classes:
-        - `class _NewDimension(Dimension):` which implements the abstract methods from
-            this class.
+    code correctness (e.g. time_method(t: Time)). It deliberately isn't an
+    `abc.ABC`, so that isinstance checks against dimensions stay on the fast
+    path instead of going through `ABCMeta.__instancecheck__`.
+
+    To add a new dimension, create 3 classes, each declaring `__slots__ = ()`:
+        - `class _NewDimension(Dimension):` which sets `_valid_base_units` (or
+            overrides `valid_base_units()`) and implements `_value_class` and
+            `_array_class`.
         - `class NewDimension(_NewDimension, ValueWithDimension)` which represents scalar
             values and doesn't need to implement any methods.
         - `class AccelerationArray(_Acceleration, ArrayWithDimension)` which represents
             an array of values sharing the same dimension and unit.
     """
 
-    @staticmethod
-    def valid_base_units() -> tuple[Value, ...]:
+    # Dimensioned values carry no per-instance attributes of their own, so every
+    # class in the hierarchy declares empty __slots__ to avoid a __dict__.
+    __slots__ = ()
+
+    # Computed once, when the subclass is defined.
+    _valid_base_units: tuple[Value, ...] = ()
+    # Base units of valid_base_units(), or None for classes that don't name any
+    # (e.g. the ValueWithDimension and ArrayWithDimension mixins).
+    _valid_base_units_set: frozenset[UnitArray] | None = None
+
+    @classmethod
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Built from valid_base_units() rather than _valid_base_units, so that
+        # subclasses overriding the method are honored too.
+        try:
+            units = cls.valid_base_units()
+        except NotImplementedError:
+            cls._valid_base_units_set = None
+        else:
+            cls._valid_base_units_set = frozenset(u.base_units for u in units)
+
+    @classmethod
+    def valid_base_units(cls) -> tuple[Value, ...]:
         """Returns a tuple of valid base units (e.g. (dB, dBm) for LogPower)."""
+        if not cls._valid_base_units:
+            raise _no_valid_base_units_error(cls)
+        return cls._valid_base_units
 
     @classmethod
     def is_valid(cls, v: WithUnit) -> bool:
-        return any(v.base_units == u.base_units for u in cls.valid_base_units())
+        try:
+            return v.base_units in cls._valid_base_units_set
+        except TypeError:
+            if cls._valid_base_units_set is None:
+                raise _no_valid_base_units_error(cls) from None
+            raise
+
+
+def _no_valid_base_units_error(cls: type[Dimension]) -> NotImplementedError:
+    return NotImplementedError(
+        f'{cls.__name__} must set _valid_base_units or override valid_base_units().'
+    )
 
 
 class _Acceleration(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['m'] / default_unit_database.known_units['s'] ** 2,
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['m'] / default_unit_database.known_units['s'] ** 2,
+    )
 
     def _value_class(self) -> type[Value]:
         return Acceleration
@@ -74,6 +107,8 @@ class _Acceleration(Dimension):
 
 
 class ValueWithDimension(Dimension, Value):
+    __slots__ = ()
+
     def __init__(self, val, unit=None, validate: bool = True):
         super().__init__(val, unit=unit)
         if validate and not type(self).is_valid(self):
@@ -81,27 +116,29 @@ class ValueWithDimension(Dimension, Value):
 
 
 class ArrayWithDimension(Dimension, ValueArray):
+    __slots__ = ()
+
     def __init__(self, val, unit=None, validate: bool = True):
         super().__init__(val, unit=unit)
         if validate and not type(self).is_valid(self):
             raise ValueError(f'{self.unit} is not a valid unit for dimension {type(self)}')
 
 
-class Acceleration(_Acceleration, ValueWithDimension): ...
+class Acceleration(_Acceleration, ValueWithDimension):
+    __slots__ = ()
 
 
-class AccelerationArray(_Acceleration, ArrayWithDimension): ...
+class AccelerationArray(_Acceleration, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Angle(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['rad'],
-            default_unit_database.known_units['sr'],
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['rad'],
+        default_unit_database.known_units['sr'],
+    )
 
     def _value_class(self) -> type[Value]:
         return Angle
@@ -110,20 +147,20 @@ class _Angle(Dimension):
         return AngleArray
 
 
-class Angle(_Angle, ValueWithDimension): ...
+class Angle(_Angle, ValueWithDimension):
+    __slots__ = ()
 
 
-class AngleArray(_Angle, ArrayWithDimension): ...
+class AngleArray(_Angle, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _AngularFrequency(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['rad'] * default_unit_database.known_units['Hz'] * 2,
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['rad'] * default_unit_database.known_units['Hz'] * 2,
+    )
 
     def _value_class(self) -> type[Value]:
         return AngularFrequency
@@ -132,18 +169,18 @@ class _AngularFrequency(Dimension):
         return AngularFrequencyArray
 
 
-class AngularFrequency(_AngularFrequency, ValueWithDimension): ...
+class AngularFrequency(_AngularFrequency, ValueWithDimension):
+    __slots__ = ()
 
 
-class AngularFrequencyArray(_AngularFrequency, ArrayWithDimension): ...
+class AngularFrequencyArray(_AngularFrequency, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Area(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['m'] ** 2,)
+    _valid_base_units = (default_unit_database.known_units['m'] ** 2,)
 
     def _value_class(self) -> type[Value]:
         return Area
@@ -152,18 +189,18 @@ class _Area(Dimension):
         return AreaArray
 
 
-class Area(_Area, ValueWithDimension): ...
+class Area(_Area, ValueWithDimension):
+    __slots__ = ()
 
 
-class AreaArray(_Area, ArrayWithDimension): ...
+class AreaArray(_Area, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Capacitance(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['farad'],)
+    _valid_base_units = (default_unit_database.known_units['farad'],)
 
     def _value_class(self) -> type[Value]:
         return Capacitance
@@ -172,18 +209,18 @@ class _Capacitance(Dimension):
         return CapacitanceArray
 
 
-class Capacitance(_Capacitance, ValueWithDimension): ...
+class Capacitance(_Capacitance, ValueWithDimension):
+    __slots__ = ()
 
 
-class CapacitanceArray(_Capacitance, ArrayWithDimension): ...
+class CapacitanceArray(_Capacitance, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Charge(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['coulomb'],)
+    _valid_base_units = (default_unit_database.known_units['coulomb'],)
 
     def _value_class(self) -> type[Value]:
         return Charge
@@ -192,21 +229,21 @@ class _Charge(Dimension):
         return ChargeArray
 
 
-class Charge(_Charge, ValueWithDimension): ...
+class Charge(_Charge, ValueWithDimension):
+    __slots__ = ()
 
 
-class ChargeArray(_Charge, ArrayWithDimension): ...
+class ChargeArray(_Charge, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _CurrentDensity(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['ampere']
-            / default_unit_database.known_units['m'] ** 2,
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['ampere']
+        / default_unit_database.known_units['m'] ** 2,
+    )
 
     def _value_class(self) -> type[Value]:
         return CurrentDensity
@@ -215,20 +252,20 @@ class _CurrentDensity(Dimension):
         return CurrentDensityArray
 
 
-class CurrentDensity(_CurrentDensity, ValueWithDimension): ...
+class CurrentDensity(_CurrentDensity, ValueWithDimension):
+    __slots__ = ()
 
 
-class CurrentDensityArray(_CurrentDensity, ArrayWithDimension): ...
+class CurrentDensityArray(_CurrentDensity, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Density(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['kg'] / default_unit_database.known_units['m'] ** 3,
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['kg'] / default_unit_database.known_units['m'] ** 3,
+    )
 
     def _value_class(self) -> type[Value]:
         return Density
@@ -237,18 +274,18 @@ class _Density(Dimension):
         return DensityArray
 
 
-class Density(_Density, ValueWithDimension): ...
+class Density(_Density, ValueWithDimension):
+    __slots__ = ()
 
 
-class DensityArray(_Density, ArrayWithDimension): ...
+class DensityArray(_Density, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _ElectricCurrent(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['ampere'],)
+    _valid_base_units = (default_unit_database.known_units['ampere'],)
 
     def _value_class(self) -> type[Value]:
         return ElectricCurrent
@@ -257,18 +294,18 @@ class _ElectricCurrent(Dimension):
         return ElectricCurrentArray
 
 
-class ElectricCurrent(_ElectricCurrent, ValueWithDimension): ...
+class ElectricCurrent(_ElectricCurrent, ValueWithDimension):
+    __slots__ = ()
 
 
-class ElectricCurrentArray(_ElectricCurrent, ArrayWithDimension): ...
+class ElectricCurrentArray(_ElectricCurrent, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _ElectricPotential(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['V'],)
+    _valid_base_units = (default_unit_database.known_units['V'],)
 
     def _value_class(self) -> type[Value]:
         return ElectricPotential
@@ -277,18 +314,18 @@ class _ElectricPotential(Dimension):
         return ElectricPotentialArray
 
 
-class ElectricPotential(_ElectricPotential, ValueWithDimension): ...
+class ElectricPotential(_ElectricPotential, ValueWithDimension):
+    __slots__ = ()
 
 
-class ElectricPotentialArray(_ElectricPotential, ArrayWithDimension): ...
+class ElectricPotentialArray(_ElectricPotential, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _ElectricalConductance(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['siemens'],)
+    _valid_base_units = (default_unit_database.known_units['siemens'],)
 
     def _value_class(self) -> type[Value]:
         return ElectricalConductance
@@ -297,18 +334,18 @@ class _ElectricalConductance(Dimension):
         return ElectricalConductanceArray
 
 
-class ElectricalConductance(_ElectricalConductance, ValueWithDimension): ...
+class ElectricalConductance(_ElectricalConductance, ValueWithDimension):
+    __slots__ = ()
 
 
-class ElectricalConductanceArray(_ElectricalConductance, ArrayWithDimension): ...
+class ElectricalConductanceArray(_ElectricalConductance, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Energy(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['joule'],)
+    _valid_base_units = (default_unit_database.known_units['joule'],)
 
     def _value_class(self) -> type[Value]:
         return Energy
@@ -317,18 +354,18 @@ class _Energy(Dimension):
         return EnergyArray
 
 
-class Energy(_Energy, ValueWithDimension): ...
+class Energy(_Energy, ValueWithDimension):
+    __slots__ = ()
 
 
-class EnergyArray(_Energy, ArrayWithDimension): ...
+class EnergyArray(_Energy, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Force(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['newton'],)
+    _valid_base_units = (default_unit_database.known_units['newton'],)
 
     def _value_class(self) -> type[Value]:
         return Force
@@ -337,18 +374,18 @@ class _Force(Dimension):
         return ForceArray
 
 
-class Force(_Force, ValueWithDimension): ...
+class Force(_Force, ValueWithDimension):
+    __slots__ = ()
 
 
-class ForceArray(_Force, ArrayWithDimension): ...
+class ForceArray(_Force, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Frequency(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['Hz'],)
+    _valid_base_units = (default_unit_database.known_units['Hz'],)
 
     def _value_class(self) -> type[Value]:
         return Frequency
@@ -357,18 +394,18 @@ class _Frequency(Dimension):
         return FrequencyArray
 
 
-class Frequency(_Frequency, ValueWithDimension): ...
+class Frequency(_Frequency, ValueWithDimension):
+    __slots__ = ()
 
 
-class FrequencyArray(_Frequency, ArrayWithDimension): ...
+class FrequencyArray(_Frequency, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Illuminance(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['lux'],)
+    _valid_base_units = (default_unit_database.known_units['lux'],)
 
     def _value_class(self) -> type[Value]:
         return Illuminance
@@ -377,18 +414,18 @@ class _Illuminance(Dimension):
         return IlluminanceArray
 
 
-class Illuminance(_Illuminance, ValueWithDimension): ...
+class Illuminance(_Illuminance, ValueWithDimension):
+    __slots__ = ()
 
 
-class IlluminanceArray(_Illuminance, ArrayWithDimension): ...
+class IlluminanceArray(_Illuminance, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Inductance(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['henry'],)
+    _valid_base_units = (default_unit_database.known_units['henry'],)
 
     def _value_class(self) -> type[Value]:
         return Inductance
@@ -397,18 +434,18 @@ class _Inductance(Dimension):
         return InductanceArray
 
 
-class Inductance(_Inductance, ValueWithDimension): ...
+class Inductance(_Inductance, ValueWithDimension):
+    __slots__ = ()
 
 
-class InductanceArray(_Inductance, ArrayWithDimension): ...
+class InductanceArray(_Inductance, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Length(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['m'],)
+    _valid_base_units = (default_unit_database.known_units['m'],)
 
     def _value_class(self) -> type[Value]:
         return Length
@@ -417,21 +454,21 @@ class _Length(Dimension):
         return LengthArray
 
 
-class Length(_Length, ValueWithDimension): ...
+class Length(_Length, ValueWithDimension):
+    __slots__ = ()
 
 
-class LengthArray(_Length, ArrayWithDimension): ...
+class LengthArray(_Length, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _LogPower(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['dBm'],
-            default_unit_database.known_units['dB'],
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['dBm'],
+        default_unit_database.known_units['dB'],
+    )
 
     def _value_class(self) -> type[Value]:
         return LogPower
@@ -440,18 +477,18 @@ class _LogPower(Dimension):
         return LogPowerArray
 
 
-class LogPower(_LogPower, ValueWithDimension): ...
+class LogPower(_LogPower, ValueWithDimension):
+    __slots__ = ()
 
 
-class LogPowerArray(_LogPower, ArrayWithDimension): ...
+class LogPowerArray(_LogPower, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _LuminousFlux(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['lumen'],)
+    _valid_base_units = (default_unit_database.known_units['lumen'],)
 
     def _value_class(self) -> type[Value]:
         return LuminousFlux
@@ -460,18 +497,18 @@ class _LuminousFlux(Dimension):
         return LuminousFluxArray
 
 
-class LuminousFlux(_LuminousFlux, ValueWithDimension): ...
+class LuminousFlux(_LuminousFlux, ValueWithDimension):
+    __slots__ = ()
 
 
-class LuminousFluxArray(_LuminousFlux, ArrayWithDimension): ...
+class LuminousFluxArray(_LuminousFlux, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _LuminousIntensity(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['candela'],)
+    _valid_base_units = (default_unit_database.known_units['candela'],)
 
     def _value_class(self) -> type[Value]:
         return LuminousIntensity
@@ -480,18 +517,18 @@ class _LuminousIntensity(Dimension):
         return LuminousIntensityArray
 
 
-class LuminousIntensity(_LuminousIntensity, ValueWithDimension): ...
+class LuminousIntensity(_LuminousIntensity, ValueWithDimension):
+    __slots__ = ()
 
 
-class LuminousIntensityArray(_LuminousIntensity, ArrayWithDimension): ...
+class LuminousIntensityArray(_LuminousIntensity, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _MagneticFlux(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['weber'],)
+    _valid_base_units = (default_unit_database.known_units['weber'],)
 
     def _value_class(self) -> type[Value]:
         return MagneticFlux
@@ -500,18 +537,18 @@ class _MagneticFlux(Dimension):
         return MagneticFluxArray
 
 
-class MagneticFlux(_MagneticFlux, ValueWithDimension): ...
+class MagneticFlux(_MagneticFlux, ValueWithDimension):
+    __slots__ = ()
 
 
-class MagneticFluxArray(_MagneticFlux, ArrayWithDimension): ...
+class MagneticFluxArray(_MagneticFlux, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _MagneticFluxDensity(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['tesla'],)
+    _valid_base_units = (default_unit_database.known_units['tesla'],)
 
     def _value_class(self) -> type[Value]:
         return MagneticFluxDensity
@@ -520,18 +557,18 @@ class _MagneticFluxDensity(Dimension):
         return MagneticFluxDensityArray
 
 
-class MagneticFluxDensity(_MagneticFluxDensity, ValueWithDimension): ...
+class MagneticFluxDensity(_MagneticFluxDensity, ValueWithDimension):
+    __slots__ = ()
 
 
-class MagneticFluxDensityArray(_MagneticFluxDensity, ArrayWithDimension): ...
+class MagneticFluxDensityArray(_MagneticFluxDensity, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Mass(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['kg'],)
+    _valid_base_units = (default_unit_database.known_units['kg'],)
 
     def _value_class(self) -> type[Value]:
         return Mass
@@ -540,21 +577,21 @@ class _Mass(Dimension):
         return MassArray
 
 
-class Mass(_Mass, ValueWithDimension): ...
+class Mass(_Mass, ValueWithDimension):
+    __slots__ = ()
 
 
-class MassArray(_Mass, ArrayWithDimension): ...
+class MassArray(_Mass, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Noise(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['V'] / default_unit_database.known_units['Hz'] ** 0.5,
-            default_unit_database.known_units['watt'] / default_unit_database.known_units['Hz'],
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['V'] / default_unit_database.known_units['Hz'] ** 0.5,
+        default_unit_database.known_units['watt'] / default_unit_database.known_units['Hz'],
+    )
 
     def _value_class(self) -> type[Value]:
         return Noise
@@ -563,18 +600,18 @@ class _Noise(Dimension):
         return NoiseArray
 
 
-class Noise(_Noise, ValueWithDimension): ...
+class Noise(_Noise, ValueWithDimension):
+    __slots__ = ()
 
 
-class NoiseArray(_Noise, ArrayWithDimension): ...
+class NoiseArray(_Noise, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Power(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['watt'],)
+    _valid_base_units = (default_unit_database.known_units['watt'],)
 
     def _value_class(self) -> type[Value]:
         return Power
@@ -583,18 +620,18 @@ class _Power(Dimension):
         return PowerArray
 
 
-class Power(_Power, ValueWithDimension): ...
+class Power(_Power, ValueWithDimension):
+    __slots__ = ()
 
 
-class PowerArray(_Power, ArrayWithDimension): ...
+class PowerArray(_Power, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Pressure(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['pascal'],)
+    _valid_base_units = (default_unit_database.known_units['pascal'],)
 
     def _value_class(self) -> type[Value]:
         return Pressure
@@ -603,18 +640,18 @@ class _Pressure(Dimension):
         return PressureArray
 
 
-class Pressure(_Pressure, ValueWithDimension): ...
+class Pressure(_Pressure, ValueWithDimension):
+    __slots__ = ()
 
 
-class PressureArray(_Pressure, ArrayWithDimension): ...
+class PressureArray(_Pressure, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Quantity(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['mole'],)
+    _valid_base_units = (default_unit_database.known_units['mole'],)
 
     def _value_class(self) -> type[Value]:
         return Quantity
@@ -623,18 +660,18 @@ class _Quantity(Dimension):
         return QuantityArray
 
 
-class Quantity(_Quantity, ValueWithDimension): ...
+class Quantity(_Quantity, ValueWithDimension):
+    __slots__ = ()
 
 
-class QuantityArray(_Quantity, ArrayWithDimension): ...
+class QuantityArray(_Quantity, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Resistance(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['ohm'],)
+    _valid_base_units = (default_unit_database.known_units['ohm'],)
 
     def _value_class(self) -> type[Value]:
         return Resistance
@@ -643,18 +680,20 @@ class _Resistance(Dimension):
         return ResistanceArray
 
 
-class Resistance(_Resistance, ValueWithDimension): ...
+class Resistance(_Resistance, ValueWithDimension):
+    __slots__ = ()
 
 
-class ResistanceArray(_Resistance, ArrayWithDimension): ...
+class ResistanceArray(_Resistance, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Speed(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['m'] / default_unit_database.known_units['s'],)
+    _valid_base_units = (
+        default_unit_database.known_units['m'] / default_unit_database.known_units['s'],
+    )
 
     def _value_class(self) -> type[Value]:
         return Speed
@@ -663,20 +702,20 @@ class _Speed(Dimension):
         return SpeedArray
 
 
-class Speed(_Speed, ValueWithDimension): ...
+class Speed(_Speed, ValueWithDimension):
+    __slots__ = ()
 
 
-class SpeedArray(_Speed, ArrayWithDimension): ...
+class SpeedArray(_Speed, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _SurfaceDensity(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['kg'] / default_unit_database.known_units['m'] ** 2,
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['kg'] / default_unit_database.known_units['m'] ** 2,
+    )
 
     def _value_class(self) -> type[Value]:
         return SurfaceDensity
@@ -685,22 +724,22 @@ class _SurfaceDensity(Dimension):
         return SurfaceDensityArray
 
 
-class SurfaceDensity(_SurfaceDensity, ValueWithDimension): ...
+class SurfaceDensity(_SurfaceDensity, ValueWithDimension):
+    __slots__ = ()
 
 
-class SurfaceDensityArray(_SurfaceDensity, ArrayWithDimension): ...
+class SurfaceDensityArray(_SurfaceDensity, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Temperature(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['kelvin'],
-            default_unit_database.known_units['celsius'],
-            default_unit_database.known_units['fahrenheit'],
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['kelvin'],
+        default_unit_database.known_units['celsius'],
+        default_unit_database.known_units['fahrenheit'],
+    )
 
     def _value_class(self) -> type[Value]:
         return Temperature
@@ -709,18 +748,18 @@ class _Temperature(Dimension):
         return TemperatureArray
 
 
-class Temperature(_Temperature, ValueWithDimension): ...
+class Temperature(_Temperature, ValueWithDimension):
+    __slots__ = ()
 
 
-class TemperatureArray(_Temperature, ArrayWithDimension): ...
+class TemperatureArray(_Temperature, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Time(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['s'],)
+    _valid_base_units = (default_unit_database.known_units['s'],)
 
     def _value_class(self) -> type[Value]:
         return Time
@@ -729,20 +768,20 @@ class _Time(Dimension):
         return TimeArray
 
 
-class Time(_Time, ValueWithDimension): ...
+class Time(_Time, ValueWithDimension):
+    __slots__ = ()
 
 
-class TimeArray(_Time, ArrayWithDimension): ...
+class TimeArray(_Time, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Torque(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (
-            default_unit_database.known_units['newton'] * default_unit_database.known_units['m'],
-        )
+    _valid_base_units = (
+        default_unit_database.known_units['newton'] * default_unit_database.known_units['m'],
+    )
 
     def _value_class(self) -> type[Value]:
         return Torque
@@ -751,18 +790,18 @@ class _Torque(Dimension):
         return TorqueArray
 
 
-class Torque(_Torque, ValueWithDimension): ...
+class Torque(_Torque, ValueWithDimension):
+    __slots__ = ()
 
 
-class TorqueArray(_Torque, ArrayWithDimension): ...
+class TorqueArray(_Torque, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _Volume(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['m'] ** 3,)
+    _valid_base_units = (default_unit_database.known_units['m'] ** 3,)
 
     def _value_class(self) -> type[Value]:
         return Volume
@@ -771,18 +810,18 @@ class _Volume(Dimension):
         return VolumeArray
 
 
-class Volume(_Volume, ValueWithDimension): ...
+class Volume(_Volume, ValueWithDimension):
+    __slots__ = ()
 
 
-class VolumeArray(_Volume, ArrayWithDimension): ...
+class VolumeArray(_Volume, ArrayWithDimension):
+    __slots__ = ()
 
 
 class _WaveNumber(Dimension):
+    __slots__ = ()
 
-    @staticmethod
-    @cache
-    def valid_base_units() -> tuple[Value, ...]:
-        return (default_unit_database.known_units['m'] ** -1,)
+    _valid_base_units = (default_unit_database.known_units['m'] ** -1,)
 
     def _value_class(self) -> type[Value]:
         return WaveNumber
@@ -791,7 +830,9 @@ class _WaveNumber(Dimension):
         return WaveNumberArray
 
 
-class WaveNumber(_WaveNumber, ValueWithDimension): ...
+class WaveNumber(_WaveNumber, ValueWithDimension):
+    __slots__ = ()
 
 
-class WaveNumberArray(_WaveNumber, ArrayWithDimension): ...
+class WaveNumberArray(_WaveNumber, ArrayWithDimension):
+    __slots__ = ()
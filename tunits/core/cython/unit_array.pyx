@@ -55,12 +55,21 @@ cpdef raw_UnitArray(name_numer_denom_tuples):
     return result
 
 
+cdef inline Py_hash_t _hash_combine(Py_hash_t h, Py_hash_t x):
+    # Unsigned arithmetic, so that overflow wraps around instead of being
+    # undefined.
+    return <Py_hash_t>((<size_t>h * <size_t>1000003) ^ <size_t>x)
+
+
 cdef class UnitArray:
     """
     A list of physical units raised to various powers.
     """
     cdef UnitTerm *units
     cdef int unit_count
+    # Cached by __hash__ (0 means not computed yet). Unit arrays aren't
+    # modified once built, so the hash can't go stale.
+    cdef Py_hash_t _hash
 
     def __cinit__(self, str name = None):
         if name is not None:
@@ -136,6 +145,22 @@ cdef class UnitArray:
                 return not match
         return match
 
+    def __hash__(UnitArray self):
+        if self._hash != 0:
+            return self._hash
+        # Consistent with __richcmp__: equal arrays have the same names and
+        # powers in the same order.
+        cdef Py_hash_t h = self.unit_count
+        cdef int i
+        for i in range(self.unit_count):
+            h = _hash_combine(h, hash(<str>self.units[i].name))
+            h = _hash_combine(h, self.units[i].power.numer)
+            h = _hash_combine(h, self.units[i].power.denom)
+        if h == -1:
+            h = -2
+        self._hash = h
+        return h
+
     def __mul__(UnitArray a, UnitArray b):
         return a.__times_div(b, +1)
 
@@ -245,6 +270,7 @@ cdef class UnitArray:
 
     def __setstate__(self, pickle_info: dict[str, Any]):
         self.unit_count = pickle_info['unit_count']
+        self._hash = 0
         self.units = <UnitTerm *>PyMem_Malloc(self.unit_count*sizeof(UnitTerm))
         for i, (name, numer, denom) in enumerate(pickle_info['units']):
             Py_INCREF(name)
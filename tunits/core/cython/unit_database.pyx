@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, Optional, Iterable, TYPE_CHECKING
+from typing import Any, Dict, Optional, Iterable
+
+import sys
 
 import numpy as np
 
-if TYPE_CHECKING:
-    import pyparsing
+# Most parsed formulas cached per database. Past this, new formulas are still
+# parsed but not cached, so arbitrary user input can't grow the cache forever.
+_FORMULA_CACHE_SIZE = 1024
+
+# Starting point for multiplying up parsed unit items. Values are immutable, so
+# it can be shared by every parse.
+_one = Value(1)
 
 
 class UnitDatabase:
@@ -28,6 +35,8 @@ class UnitDatabase:
     known units.
     """
 
+    __slots__ = ('known_units', 'auto_create_units', '_formula_cache')
+
     def __init__(self, auto_create_units: bool = True):
         """
         :param auto_create_units: Determines if unrecognized strings are
@@ -35,6 +44,10 @@ class UnitDatabase:
         """
         self.known_units: Dict[str, Value] = {}
         self.auto_create_units = auto_create_units
+        # Parsed simple formulas (no scalar factor), keyed by formula string.
+        # Units can't be redefined once added, so a cached result never goes
+        # stale.
+        self._formula_cache: Dict[str, Value] = {}
 
     def get_unit(self, unit_name: str, auto_create: Optional[bool] = None) -> Value:
         """
@@ -44,11 +57,13 @@ class UnitDatabase:
         defaults to the 'auto_create_units' attribute of the receiving instance.
         :return Value: The unit with the given name.
         """
+        unit = self.known_units.get(unit_name)
+        if unit is not None:
+            return unit
         auto_create = self.auto_create_units if auto_create is None else auto_create
-        if unit_name not in self.known_units:
-            if not auto_create:
-                raise KeyError("No unit named '%s'." % unit_name)
-            self.add_root_unit(unit_name)
+        if not auto_create:
+            raise KeyError("No unit named '%s'." % unit_name)
+        self.add_root_unit(unit_name)
         return self.known_units[unit_name]
 
     def parse_unit_formula(self, formula: str, auto_create: Optional[bool] = None) -> Value:
@@ -60,30 +75,48 @@ class UnitDatabase:
         receiving instance.
         :return Value: The value described by the formula.
         """
-        if formula in self.known_units:
-            return self.known_units[formula]
-        parsed = unit_regex.parse_string(formula)
-        result = Value(parsed.factor or 1)
-        for item in parsed.posexp:
-            result *= self._parse_unit_item(item, +1, auto_create)
-        for item in parsed.negexp:
-            result *= self._parse_unit_item(item, -1, auto_create)
+        result = self.known_units.get(formula)
+        if result is None:
+            result = self._formula_cache.get(formula)
+        if result is not None:
+            return result
+        factor = None
+        tokens = tokenize_simple_unit_formula(formula)
+        cacheable = tokens is not None and len(self._formula_cache) < _FORMULA_CACHE_SIZE
+        if tokens is None:
+            factor, tokens = parse_unit_formula_items(formula)
+        if factor is None and len(tokens) == 1:
+            # Skip multiplying into Value(1), but use a float exponent so the
+            # value still comes out as a float, as it would from that multiply.
+            unit_name, sign, numer, denom = tokens[0]
+            result = self.get_unit(unit_name, auto_create) ** (sign * float(numer) / denom)
+        else:
+            result = _one if factor is None else Value(factor)
+            for unit_name, sign, numer, denom in tokens:
+                result *= self._unit_power(unit_name, sign, numer, denom, auto_create)
+        if cacheable:
+            self._formula_cache[formula] = result
         return result
 
-    def _parse_unit_item(
-        self, item: 'pyparsing.results.ParseResults', neg: int, auto_create: bool | None = None
+    def _unit_power(
+        self, unit_name: str, sign: int, numer: int, denom: int, auto_create: bool | None = None
     ) -> Value:
         """
-        :param item: A unit+exponent group parsed by .
-        :param neg: Are we multiplying (+1) or dividing (-1)?
+        :param str unit_name: The unit to look up.
+        :param int sign: +1 or -1, the sign of the exponent.
+        :param int numer: The exponent's numerator.
+        :param int denom: The exponent's denominator.
         :param None|bool auto_create: see parse_unit_formula
+        :return Value: The unit raised to the power sign*numer/denom.
         """
-        unit_name = item.name
-        numer = item.num or 1
-        denom = item.denom or 1
-        sign = neg * (-1 if item.neg else 1)
         unit_val = self.get_unit(unit_name, auto_create)
-        return unit_val ** (sign * float(numer) / denom)
+        if denom != 1:
+            return unit_val ** (sign * float(numer) / denom)
+        # Integer exponents skip the float-to-twelfths rounding in __pow__, and
+        # the common bare unit skips the power entirely.
+        if sign * numer == 1:
+            return unit_val
+        return unit_val ** (sign * numer)
 
     def add_unit(self, unit_name: str, unit_base_value: Value) -> None:
         """
@@ -98,17 +131,20 @@ class UnitDatabase:
                 "Unit name '%s' already taken by '%s'."
                 % (unit_name, self.known_units[unit_name].in_base_units())
             )
-        self.known_units[unit_name] = unit_base_value
+        # Interned keys let lookups with the same name object (e.g. names held
+        # by unit arrays) match on identity instead of comparing characters.
+        self.known_units[sys.intern(unit_name)] = unit_base_value
 
     def add_root_unit(self, unit_name: str) -> None:
         """
         Adds a plain unit, not defined in terms of anything else, to the database.
         :param str unit_name: Key and unit array entry for the new unit.
         """
+        unit_name = sys.intern(unit_name)
         ua = UnitArray(unit_name)
         unit: Value = raw_WithUnit(
             1,
-            {'factor': 1.0, 'ratio': {'numer': 1, 'denom': 1}, 'exp10': 0},
+            identity_conversion(),
             ua,
             ua,
             Value,
@@ -122,7 +158,10 @@ class UnitDatabase:
         :param str alternate_name: The new alternate name for the unit.
         :param str unit_name: The existing name for the unit.
         """
-        self.add_unit(alternate_name, self.get_unit(unit_name, auto_create=False))
+        unit = self.known_units.get(unit_name)
+        if unit is None:
+            raise KeyError("No unit named '%s'." % unit_name)
+        self.add_unit(alternate_name, unit)
 
     def add_scaled_unit(
         self,
@@ -145,16 +184,38 @@ class UnitDatabase:
         :param int exp10: An exact power-of-10 for converting to the base unit.
         """
         parent = self.parse_unit_formula(formula, auto_create=False)
+        self._add_scaled_unit_from_parent(unit_name, parent, factor, numer, denom, exp10)
 
+    def _add_scaled_unit_from_parent(
+        self,
+        unit_name: str,
+        parent: Value,
+        factor: int | float | complex | np.number[Any] = 1.0,
+        numer: int = 1,
+        denom: int = 1,
+        exp10: int = 0,
+    ) -> None:
+        """
+        Like add_scaled_unit, but takes the already-known parent value so that
+        callers adding many units based on the same formula (e.g. all the
+        prefixed variants of a unit) don't have to parse it again.
+        :param str unit_name: Name of the derived unit.
+        :param Value parent: The value of the unit's formula.
+        :param float factor: A lossy factor for converting to the base unit.
+        :param int numer: An exact factor for converting to the base unit.
+        :param int denom: An exact divisor for converting to the base unit.
+        :param int exp10: An exact power-of-10 for converting to the base unit.
+        """
         unit: Value = raw_WithUnit(
             1,
-            {
-                'factor': factor * parent.factor * parent.value,
-                'ratio': {'numer': numer * parent.numer, 'denom': denom * parent.denom},
-                'exp10': exp10 + parent.exp10,
-            },
+            make_conversion(
+                factor * parent.factor * parent.value,
+                numer * parent.numer,
+                denom * parent.denom,
+                exp10 + parent.exp10,
+            ),
             parent.base_units,
-            UnitArray(unit_name),
+            UnitArray(sys.intern(unit_name)),
             Value,
             ValueArray,
         )
@@ -176,15 +237,13 @@ class UnitDatabase:
         if symbol == 'kg':
             symbol = 'g'
             name = 'gram'
-            self.add_scaled_unit('g', 'kg', exp10=-3)
+            self._add_scaled_unit_from_parent('g', self.known_units['kg'], exp10=-3)
             self.add_alternate_unit_name('gram', 'g')
 
         if data.use_prefixes:
-            for pre in prefixes:
-                if symbol == 'g' and pre.symbol == 'k':
-                    continue
-                self.add_scaled_unit(pre.symbol + symbol, symbol, exp10=pre.exp10)
-                self.add_alternate_unit_name(pre.name + name, pre.symbol + symbol)
+            if symbol == 'g':
+                prefixes = [pre for pre in prefixes if pre.symbol != 'k']
+            self._add_prefixed_units(symbol, name, prefixes)
 
     def add_derived_unit_data(self, data: DerivedUnitData, prefixes: list[PrefixData]) -> None:
         """
@@ -193,24 +252,48 @@ class UnitDatabase:
         :param DerivedUnitData data:
         :param list[PrefixData] prefixes:
         """
-        self.add_scaled_unit(
-            data.symbol, data.formula, data.value, data.numerator, data.denominator, data.exp10
+        parent = self.parse_unit_formula(data.formula, auto_create=False)
+        self._add_scaled_unit_from_parent(
+            data.symbol, parent, data.value, data.numerator, data.denominator, data.exp10
         )
         if data.name is not None:
             self.add_alternate_unit_name(data.name, data.symbol)
 
         if data.use_prefixes:
-            for pre in prefixes:
-                self.add_scaled_unit(
-                    pre.symbol + data.symbol,
-                    data.formula,
-                    data.value,
-                    data.numerator,
-                    data.denominator,
-                    data.exp10 + pre.exp10,
-                )
-                if data.name is not None:
-                    self.add_alternate_unit_name(pre.name + data.name, pre.symbol + data.symbol)
+            self._add_prefixed_units(data.symbol, data.name, prefixes)
+
+    def _add_prefixed_units(
+        self, symbol: str, name: str | None, prefixes: list[PrefixData]
+    ) -> None:
+        """
+        Adds a prefixed variant of an existing unit for each of the given
+        prefixes (e.g. 'kHz', with alternate name 'kilohertz', for 'Hz'). The
+        variants only differ from the unit by a power of 10, so the rest of the
+        conversion is computed once for all of them.
+        :param str symbol: The existing unit's name.
+        :param None|str name: The existing unit's alternate long name, if any.
+        :param list[PrefixData] prefixes:
+        """
+        unit = self.known_units[symbol]
+        cdef conversion conv = make_conversion(
+            unit.factor * unit.value, unit.numer, unit.denom, unit.exp10
+        )
+        cdef int exp10 = conv.exp10
+        base_units = unit.base_units
+        for pre in prefixes:
+            prefixed_symbol = sys.intern(pre.symbol + symbol)
+            conv.exp10 = exp10 + pre.exp10
+            prefixed_unit: Value = raw_WithUnit(
+                1,
+                conv,
+                base_units,
+                UnitArray(prefixed_symbol),
+                Value,
+                ValueArray,
+            )
+            self.add_unit(prefixed_symbol, prefixed_unit)
+            if name is not None:
+                self.add_alternate_unit_name(pre.name + name, prefixed_symbol)
 
     def add_physical_constant_data(self, data: PhysicalConstantData) -> None:
         """
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+
 from pyparsing import (
     Word,
     Literal,
@@ -61,3 +63,67 @@ unit_regex = (
     + ZeroOrMore(times_unit | Optional('1') + over_unit)
     + stringEnd
 )
+
+
+# Fast path for the common `name^exp` items joined by `*` and `/` (e.g.
+# 'kg*m/s^2'). Anything fancier (a scalar factor, whitespace, parenthesized
+# exponents) doesn't match and falls back to the full `unit_regex` grammar.
+_simple_item = r'([A-Za-z][A-Za-z0-9]*)(?:\^(-?)([0-9]+)(?:/([0-9]+))?)?'
+_simple_formula = re.compile(r'(?:%s)?(?:(?:\*|1?/)%s)*' % (_simple_item, _simple_item))
+_simple_token = re.compile(r'(?:\*|1?(/))?' + _simple_item)
+
+
+def _exponent(numer: int | str, denom: int | str, formula: str) -> tuple[int, int]:
+    """
+    Normalizes a unit item's exponent the same way for both parsing paths. A
+    missing numerator or denominator means 1, and so does a zero numerator, as
+    the grammar has always treated it.
+    :raises ValueError: The denominator is zero.
+    """
+    numer = 1 if numer == '' else int(numer)
+    denom = 1 if denom == '' else int(denom)
+    if denom == 0:
+        raise ValueError("Zero exponent denominator in unit formula '%s'." % formula)
+    return numer or 1, denom
+
+
+def tokenize_simple_unit_formula(formula: str) -> list[tuple[str, int, int, int]] | None:
+    """
+    Splits a simple unit formula into its unit items.
+    :param str formula: Describes a combination of units.
+    :return None|list[(str, int, int, int)]: A (name, sign, numer, denom)
+    tuple for each unit item, or None if the formula needs the full grammar.
+    :raises ValueError: An exponent has a zero denominator.
+    """
+    if _simple_formula.fullmatch(formula) is None:
+        return None
+    return [
+        (name, -1 if (div == '/') != (neg == '-') else 1, *_exponent(numer, denom, formula))
+        for div, name, neg, numer, denom in _simple_token.findall(formula)
+    ]
+
+
+def parse_unit_formula_items(
+    formula: str,
+) -> tuple[float | None, list[tuple[str, int, int, int]]]:
+    """
+    Parses a unit formula with the full grammar.
+    :param str formula: Describes a combination of units.
+    :return (None|float, list[(str, int, int, int)]): The scalar factor (None
+    if there isn't one) and a (name, sign, numer, denom) tuple for each unit
+    item, multiplied items first.
+    :raises pyparsing.ParseException: The formula is malformed.
+    :raises ValueError: An exponent has a zero denominator.
+    """
+    parsed = unit_regex.parse_string(formula)
+    items = []
+    for group, neg in ((parsed.posexp, False), (parsed.negexp, True)):
+        for item in group:
+            items.append(
+                (
+                    item.name,
+                    -1 if neg != bool(item.neg) else 1,
+                    *_exponent(item.num, item.denom, formula),
+                )
+            )
+    return parsed.factor or None, items
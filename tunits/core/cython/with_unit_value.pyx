@@ -21,6 +21,12 @@ T = TypeVar('Value', bound='Value')
 class Value(WithUnit):
     """A floating-point value with associated units."""
 
+    # All state lives in the WithUnit C struct. Value, ValueArray and every
+    # dimension class declare __slots__, so values have no per-instance
+    # __dict__ and arbitrary attributes can't be set on them. Weak references
+    # still work.
+    __slots__ = ('__weakref__',)
+
     @classmethod
     def from_proto(cls: type[T], msg: 'tunits_pb2.Value') -> T:
         if msg.HasField('real_value'):
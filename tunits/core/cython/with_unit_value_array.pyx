@@ -38,6 +38,8 @@ def _canonize_data_and_unit(data, unit=None):
 
 class ValueArray(WithUnit):
 
+    __slots__ = ('__weakref__',)
+
     def __init__(WithUnit self, data, unit=None):
         """
         Initializes an array of values with an associated unit.